@@ -108,19 +108,42 @@ class SkillsLoader:
         Returns:
             XML-formatted skills summary.
         """
-        all_skills = self.list_skills(filter_unavailable=False)
-        if not all_skills:
+        return self.render_skills_summary(self.collect_skill_entries())
+
+    def collect_skill_entries(self) -> list[dict]:
+        """
+        Read every skill's frontmatter for the summary.
+
+        This is the file-reading half of build_skills_summary, so callers can
+        cache it while still re-checking requirements on each render.
+
+        Returns:
+            List of dicts with 'name', 'path', 'description' and 'meta'.
+        """
+        return [
+            {
+                "name": s["name"],
+                "path": s["path"],
+                "description": self._get_skill_description(s["name"]),
+                "meta": self._get_skill_meta(s["name"]),
+            }
+            for s in self.list_skills(filter_unavailable=False)
+        ]
+
+    def render_skills_summary(self, entries: list[dict]) -> str:
+        """Render skill entries as XML, checking requirements (bins, env vars) at call time."""
+        if not entries:
             return ""
 
         def escape_xml(s: str) -> str:
             return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
         lines = ["<skills>"]
-        for s in all_skills:
+        for s in entries:
             name = escape_xml(s["name"])
             path = s["path"]
-            desc = escape_xml(self._get_skill_description(s["name"]))
-            skill_meta = self._get_skill_meta(s["name"])
+            desc = escape_xml(s["description"])
+            skill_meta = s["meta"]
             available = self._check_requirements(skill_meta)
 
             lines.append(f"  <skill available=\"{str(available).lower()}\">")
@@ -1,13 +1,15 @@
 """Subagent manager for background task execution."""
 
 import asyncio
-import json
-import uuid
+import secrets
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from loguru import logger
 
+from nanobot.agent.context import ContextBuilder
+from nanobot.agent.skills import BUILTIN_SKILLS_DIR, SkillsLoader
+from nanobot.agent.tools.base import Tool
 from nanobot.agent.tools.filesystem import EditFileTool, ListDirTool, ReadFileTool, WriteFileTool
 from nanobot.agent.tools.registry import ToolRegistry
 from nanobot.agent.tools.shell import ExecTool
@@ -32,13 +34,12 @@ class SubagentManager:
         reasoning_effort: str | None = None,
         brave_api_key: str | None = None,
         web_proxy: str | None = None,
-        exec_config: "ExecToolConfig | None" = None,
+        exec_config: ExecToolConfig | None = None,
         restrict_to_workspace: bool = False,
         default_max_iterations: int = 15,
         parent_mcp_tools: ToolRegistry | None = None,
         disabled_tools: list[str] | None = None,
     ):
-        from nanobot.config.schema import ExecToolConfig
         self.provider = provider
         self.workspace = workspace
         self.bus = bus
@@ -55,6 +56,27 @@ class SubagentManager:
         self._disabled_tools = disabled_tools or []
         self._running_tasks: dict[str, asyncio.Task[None]] = {}
         self._session_tasks: dict[str, set[str]] = {}  # session_key -> {task_id, ...}
+        self._skills_loader = SkillsLoader(workspace)
+        self._skill_entries_cache: tuple[tuple[tuple[str, int], ...], list[dict]] | None = None
+
+        # Each subagent run gets fresh tool instances; configuration is bound once here.
+        # web_search is stateless apart from its keep-alive client, so runs share one instance.
+        allowed_dir = self.workspace if self.restrict_to_workspace else None
+        self._web_search = WebSearchTool(api_key=self.brave_api_key, proxy=self.web_proxy)
+        self._tool_factories: dict[str, Callable[[], Tool]] = {
+            "read_file": lambda: ReadFileTool(workspace=self.workspace, allowed_dir=allowed_dir),
+            "write_file": lambda: WriteFileTool(workspace=self.workspace, allowed_dir=allowed_dir),
+            "edit_file": lambda: EditFileTool(workspace=self.workspace, allowed_dir=allowed_dir),
+            "list_dir": lambda: ListDirTool(workspace=self.workspace, allowed_dir=allowed_dir),
+            "exec": lambda: ExecTool(
+                working_dir=str(self.workspace),
+                timeout=self.exec_config.timeout,
+                restrict_to_workspace=self.restrict_to_workspace,
+                path_append=self.exec_config.path_append,
+            ),
+            "web_search": lambda: self._web_search,
+            "web_fetch": lambda: WebFetchTool(proxy=self.web_proxy),
+        }
 
     async def spawn(
         self,
@@ -65,7 +87,7 @@ class SubagentManager:
         session_key: str | None = None,
     ) -> str:
         """Spawn a subagent to execute a task in the background."""
-        task_id = str(uuid.uuid4())[:8]
+        task_id = secrets.token_hex(4)
         display_label = label or task[:30] + ("..." if len(task) > 30 else "")
         origin = {"channel": origin_channel, "chat_id": origin_chat_id}
 
@@ -101,19 +123,8 @@ class SubagentManager:
         try:
             # Build subagent tools (no message tool, no spawn tool)
             tools = ToolRegistry()
-            allowed_dir = self.workspace if self.restrict_to_workspace else None
-            tools.register(ReadFileTool(workspace=self.workspace, allowed_dir=allowed_dir))
-            tools.register(WriteFileTool(workspace=self.workspace, allowed_dir=allowed_dir))
-            tools.register(EditFileTool(workspace=self.workspace, allowed_dir=allowed_dir))
-            tools.register(ListDirTool(workspace=self.workspace, allowed_dir=allowed_dir))
-            tools.register(ExecTool(
-                working_dir=str(self.workspace),
-                timeout=self.exec_config.timeout,
-                restrict_to_workspace=self.restrict_to_workspace,
-                path_append=self.exec_config.path_append,
-            ))
-            tools.register(WebSearchTool(api_key=self.brave_api_key, proxy=self.web_proxy))
-            tools.register(WebFetchTool(proxy=self.web_proxy))
+            for factory in self._tool_factories.values():
+                tools.register(factory())
             if self._parent_mcp_tools:
                 for name in self._parent_mcp_tools.tool_names:
                     tool = self._parent_mcp_tools.get(name)
@@ -147,28 +158,21 @@ class SubagentManager:
 
                 if response.has_tool_calls:
                     # Add assistant message with tool calls
-                    tool_call_dicts = [
-                        {
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.name,
-                                "arguments": json.dumps(tc.arguments, ensure_ascii=False),
-                            },
-                        }
-                        for tc in response.tool_calls
-                    ]
+                    tool_call_dicts = [tc.to_openai_tool_call() for tc in response.tool_calls]
                     messages.append({
                         "role": "assistant",
                         "content": response.content or "",
                         "tool_calls": tool_call_dicts,
                     })
 
-                    # Execute tools
-                    for tool_call in response.tool_calls:
-                        args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
+                    # Execute tools (read-only calls run concurrently)
+                    for tool_call, call_dict in zip(response.tool_calls, tool_call_dicts):
+                        args_str = call_dict["function"]["arguments"]
                         logger.debug("Subagent [{}] executing: {} with arguments: {}", task_id, tool_call.name, args_str)
-                        result = await tools.execute(tool_call.name, tool_call.arguments)
+                    results = await tools.execute_all(
+                        [(tc.name, tc.arguments) for tc in response.tool_calls]
+                    )
+                    for tool_call, result in zip(response.tool_calls, results):
                         messages.append({
                             "role": "tool",
                             "tool_call_id": tool_call.id,
@@ -244,26 +248,43 @@ Summarize this naturally for the user. Keep it brief (1-2 sentences). Do not men
     
     def _build_subagent_prompt(self) -> str:
         """Build a focused system prompt for the subagent."""
-        from nanobot.agent.context import ContextBuilder
-        from nanobot.agent.skills import SkillsLoader
-
         time_ctx = ContextBuilder._build_runtime_context(None, None)
-        parts = [f"""# Subagent
+        return f"# Subagent\n\n{time_ctx}\n\n{self._subagent_prompt_body()}"
 
-{time_ctx}
-
-You are a subagent spawned by the main agent to complete a specific task.
+    def _subagent_prompt_body(self) -> str:
+        """Return the time-independent part of the subagent prompt."""
+        parts = [f"""You are a subagent spawned by the main agent to complete a specific task.
 Stay focused on the assigned task. Your final response will be reported back to the main agent.
 
 ## Workspace
 {self.workspace}"""]
 
-        skills_summary = SkillsLoader(self.workspace).build_skills_summary()
+        skills_summary = self._skills_loader.render_skills_summary(self._skill_entries())
         if skills_summary:
             parts.append(f"## Skills\n\nRead SKILL.md with read_file to use a skill.\n\n{skills_summary}")
 
         return "\n\n".join(parts)
-    
+
+    def _skill_entries(self) -> list[dict]:
+        """Return parsed skill frontmatter, re-read only when skill files change on disk."""
+        signature = self._skills_signature()
+        if self._skill_entries_cache is None or self._skill_entries_cache[0] != signature:
+            self._skill_entries_cache = (signature, self._skills_loader.collect_skill_entries())
+        return self._skill_entries_cache[1]
+
+    def _skills_signature(self) -> tuple[tuple[str, int], ...]:
+        """Fingerprint skill files by path and mtime so edits on disk invalidate the cached entries."""
+        signature = []
+        for root in (self.workspace / "skills", BUILTIN_SKILLS_DIR):
+            if not root.is_dir():
+                continue
+            for skill_file in sorted(root.glob("*/SKILL.md")):
+                try:
+                    signature.append((str(skill_file), skill_file.stat().st_mtime_ns))
+                except OSError:
+                    continue
+        return tuple(signature)
+
     async def cancel_by_session(self, session_key: str) -> int:
         """Cancel all subagents for the given session. Returns count cancelled."""
         tasks = [self._running_tasks[tid] for tid in self._session_tasks.get(session_key, [])
@@ -274,6 +295,15 @@ Stay focused on the assigned task. Your final response will be reported back to
             await asyncio.gather(*tasks, return_exceptions=True)
         return len(tasks)
 
+    async def aclose(self) -> None:
+        """Cancel running subagents, then close the shared web_search client."""
+        tasks = [t for t in self._running_tasks.values() if not t.done()]
+        for t in tasks:
+            t.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await self._web_search.aclose()
+
     def get_running_count(self) -> int:
         """Return the number of currently running subagents."""
         return len(self._running_tasks)
@@ -1,6 +1,7 @@
 """Base class for agent tools."""
 
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Any
 
 
@@ -21,6 +22,9 @@ class Tool(ABC):
         "object": dict,
     }
 
+    # Read-only tools with no side effects may run concurrently with each other
+    parallel_safe: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -39,6 +43,11 @@ class Tool(ABC):
         """JSON Schema for tool parameters."""
         pass
 
+    @cached_property
+    def _cached_parameters(self) -> dict[str, Any]:
+        """Parameter schema resolved once per instance (tool schemas are static)."""
+        return self.parameters or {}
+
     @abstractmethod
     async def execute(self, **kwargs: Any) -> str:
         """
@@ -54,7 +63,7 @@ class Tool(ABC):
 
     def cast_params(self, params: dict[str, Any]) -> dict[str, Any]:
         """Apply safe schema-driven casts before validation."""
-        schema = self.parameters or {}
+        schema = self._cached_parameters
         if schema.get("type", "object") != "object":
             return params
 
@@ -125,10 +134,12 @@ class Tool(ABC):
         """Validate tool parameters against JSON schema. Returns error list (empty if valid)."""
         if not isinstance(params, dict):
             return [f"parameters must be an object, got {type(params).__name__}"]
-        schema = self.parameters or {}
+        schema = self._cached_parameters
         if schema.get("type", "object") != "object":
             raise ValueError(f"Schema must be object type, got {schema.get('type')!r}")
-        return self._validate(params, {**schema, "type": "object"}, "")
+        if "type" not in schema:
+            schema = {**schema, "type": "object"}
+        return self._validate(params, schema, "")
 
     def _validate(self, val: Any, schema: dict[str, Any], path: str) -> list[str]:
         t, label = schema.get("type"), path or "parameter"
@@ -38,37 +38,35 @@ class CronTool(Tool):
     def description(self) -> str:
         return "Schedule reminders and recurring tasks. Actions: add, list, remove."
 
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": ["add", "list", "remove"],
-                    "description": "Action to perform",
-                },
-                "message": {"type": "string", "description": "Reminder message (for add)"},
-                "every_seconds": {
-                    "type": "integer",
-                    "description": "Interval in seconds (for recurring tasks)",
-                },
-                "cron_expr": {
-                    "type": "string",
-                    "description": "Cron expression like '0 9 * * *' (for scheduled tasks)",
-                },
-                "tz": {
-                    "type": "string",
-                    "description": "IANA timezone for cron expressions (e.g. 'America/Vancouver')",
-                },
-                "at": {
-                    "type": "string",
-                    "description": "ISO datetime for one-time execution (e.g. '2026-02-12T10:30:00')",
-                },
-                "job_id": {"type": "string", "description": "Job ID (for remove)"},
+    parameters = {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": ["add", "list", "remove"],
+                "description": "Action to perform",
+            },
+            "message": {"type": "string", "description": "Reminder message (for add)"},
+            "every_seconds": {
+                "type": "integer",
+                "description": "Interval in seconds (for recurring tasks)",
+            },
+            "cron_expr": {
+                "type": "string",
+                "description": "Cron expression like '0 9 * * *' (for scheduled tasks)",
+            },
+            "tz": {
+                "type": "string",
+                "description": "IANA timezone for cron expressions (e.g. 'America/Vancouver')",
+            },
+            "at": {
+                "type": "string",
+                "description": "ISO datetime for one-time execution (e.g. '2026-02-12T10:30:00')",
             },
-            "required": ["action"],
-        }
+            "job_id": {"type": "string", "description": "Job ID (for remove)"},
+        },
+        "required": ["action"],
+    }
 
     async def execute(
         self,
@@ -1,6 +1,7 @@
 """File system tools: read, write, edit."""
 
 import difflib
+import os
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +27,7 @@ def _resolve_path(
 class ReadFileTool(Tool):
     """Tool to read file contents."""
 
+    parallel_safe = True
     _MAX_CHARS = 128_000  # ~128 KB — prevents OOM from reading huge files into LLM context
 
     def __init__(self, workspace: Path | None = None, allowed_dir: Path | None = None):
@@ -40,13 +42,11 @@ class ReadFileTool(Tool):
     def description(self) -> str:
         return "Read the contents of a file at the given path."
 
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {"path": {"type": "string", "description": "The file path to read"}},
-            "required": ["path"],
-        }
+    parameters = {
+        "type": "object",
+        "properties": {"path": {"type": "string", "description": "The file path to read"}},
+        "required": ["path"],
+    }
 
     async def execute(self, path: str, **kwargs: Any) -> str:
         try:
@@ -88,16 +88,14 @@ class WriteFileTool(Tool):
     def description(self) -> str:
         return "Write content to a file at the given path. Creates parent directories if needed."
 
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "path": {"type": "string", "description": "The file path to write to"},
-                "content": {"type": "string", "description": "The content to write"},
-            },
-            "required": ["path", "content"],
-        }
+    parameters = {
+        "type": "object",
+        "properties": {
+            "path": {"type": "string", "description": "The file path to write to"},
+            "content": {"type": "string", "description": "The content to write"},
+        },
+        "required": ["path", "content"],
+    }
 
     async def execute(self, path: str, content: str, **kwargs: Any) -> str:
         try:
@@ -126,17 +124,15 @@ class EditFileTool(Tool):
     def description(self) -> str:
         return "Edit a file by replacing old_text with new_text. The old_text must exist exactly in the file."
 
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "path": {"type": "string", "description": "The file path to edit"},
-                "old_text": {"type": "string", "description": "The exact text to find and replace"},
-                "new_text": {"type": "string", "description": "The text to replace with"},
-            },
-            "required": ["path", "old_text", "new_text"],
-        }
+    parameters = {
+        "type": "object",
+        "properties": {
+            "path": {"type": "string", "description": "The file path to edit"},
+            "old_text": {"type": "string", "description": "The exact text to find and replace"},
+            "new_text": {"type": "string", "description": "The text to replace with"},
+        },
+        "required": ["path", "old_text", "new_text"],
+    }
 
     async def execute(self, path: str, old_text: str, new_text: str, **kwargs: Any) -> str:
         try:
@@ -195,6 +191,8 @@ class EditFileTool(Tool):
 class ListDirTool(Tool):
     """Tool to list directory contents."""
 
+    parallel_safe = True
+
     def __init__(self, workspace: Path | None = None, allowed_dir: Path | None = None):
         self._workspace = workspace
         self._allowed_dir = allowed_dir
@@ -207,13 +205,11 @@ class ListDirTool(Tool):
     def description(self) -> str:
         return "List the contents of a directory."
 
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {"path": {"type": "string", "description": "The directory path to list"}},
-            "required": ["path"],
-        }
+    parameters = {
+        "type": "object",
+        "properties": {"path": {"type": "string", "description": "The directory path to list"}},
+        "required": ["path"],
+    }
 
     async def execute(self, path: str, **kwargs: Any) -> str:
         try:
@@ -223,10 +219,10 @@ class ListDirTool(Tool):
             if not dir_path.is_dir():
                 return f"Error: Not a directory: {path}"
 
-            items = []
-            for item in sorted(dir_path.iterdir()):
-                prefix = "📁 " if item.is_dir() else "📄 "
-                items.append(f"{prefix}{item.name}")
+            # scandir entries carry the file type, avoiding a stat() per Path
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+            items = [f"{'📁 ' if e.is_dir() else '📄 '}{e.name}" for e in entries]
 
             if not items:
                 return f"Directory {path} is empty"
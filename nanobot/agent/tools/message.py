@@ -44,31 +44,29 @@ class MessageTool(Tool):
     def description(self) -> str:
         return "Send a message to the user. Use this when you want to communicate something."
 
-    @property
-    def parameters(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "content": {
-                    "type": "string",
-                    "description": "The message content to send"
-                },
-                "channel": {
-                    "type": "string",
-                    "description": "Optional: target channel (telegram, discord, etc.)"
-                },
-                "chat_id": {
-                    "type": "string",
-                    "description": "Optional: target chat/user ID"
-                },
-                "media": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Optional: list of file paths to attach (images, audio, documents)"
-                }
+    parameters = {
+        "type": "object",
+        "properties": {
+            "content": {
+                "type": "string",
+                "description": "The message content to send"
+            },
+            "channel": {
+                "type": "string",
+                "description": "Optional: target channel (telegram, discord, etc.)"
+            },
+            "chat_id": {
+                "type": "string",
+                "description": "Optional: target chat/user ID"
             },
-            "required": ["content"]
-        }
+            "media": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Optional: list of file paths to attach (images, audio, documents)"
+            }
+        },
+        "required": ["content"]
+    }
 
     async def execute(
         self,
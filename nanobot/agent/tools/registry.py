@@ -1,5 +1,6 @@
 """Tool registry for dynamic tool management."""
 
+import asyncio
 from fnmatch import fnmatch
 from typing import Any
 
@@ -17,14 +18,17 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        self._definitions: list[dict[str, Any]] | None = None
 
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._definitions = None
 
     def unregister(self, name: str) -> None:
         """Unregister a tool by name."""
         self._tools.pop(name, None)
+        self._definitions = None
 
     def get(self, name: str) -> Tool | None:
         """Get a tool by name."""
@@ -35,8 +39,10 @@ class ToolRegistry:
         return name in self._tools
 
     def get_definitions(self) -> list[dict[str, Any]]:
-        """Get all tool definitions in OpenAI format."""
-        return [tool.to_schema() for tool in self._tools.values()]
+        """Get all tool definitions in OpenAI format (cached until the tool set changes)."""
+        if self._definitions is None:
+            self._definitions = [tool.to_schema() for tool in self._tools.values()]
+        return list(self._definitions)
 
     async def execute(self, name: str, params: dict[str, Any]) -> str:
         """Execute a tool by name with given parameters."""
@@ -61,6 +67,31 @@ class ToolRegistry:
         except Exception as e:
             return f"Error executing {name}: {str(e)}" + _HINT
 
+    async def execute_all(self, calls: list[tuple[str, dict[str, Any]]]) -> list[str]:
+        """
+        Execute (name, params) calls and return results in call order.
+
+        Consecutive calls to parallel-safe tools run concurrently; any other
+        tool waits for the preceding calls and runs on its own.
+        """
+        results: list[str] = []
+        batch: list[tuple[str, dict[str, Any]]] = []
+
+        async def flush() -> None:
+            if batch:
+                results.extend(await asyncio.gather(*(self.execute(n, p) for n, p in batch)))
+                batch.clear()
+
+        for name, params in calls:
+            tool = self._tools.get(name)
+            if tool is not None and tool.parallel_safe:
+                batch.append((name, params))
+                continue
+            await flush()
+            results.append(await self.execute(name, params))
+        await flush()
+        return results
+
     @property
     def tool_names(self) -> list[str]:
         """Get list of registered tool names."""
@@ -83,6 +114,7 @@ class ToolRegistry:
         ]
         for name in to_remove:
             del self._tools[name]
+            self._definitions = None
             logger.info("Tool '{}' disabled by filter", name)
         if not to_remove:
             logger.warning("Disabled tool filter matched nothing: patterns={}", patterns)
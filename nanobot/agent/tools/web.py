@@ -4,6 +4,7 @@ import html
 import json
 import os
 import re
+from contextlib import AbstractAsyncContextManager, nullcontext
 from typing import Any
 from urllib.parse import urlparse
 
@@ -57,11 +58,29 @@ class WebSearchTool(Tool):
         },
         "required": ["query"]
     }
+    parallel_safe = True
 
     def __init__(self, api_key: str | None = None, max_results: int = 5, proxy: str | None = None):
         self._init_api_key = api_key
         self.max_results = max_results
         self.proxy = proxy
+        self._client: httpx.AsyncClient | None = None
+        self._closed = False
+
+    def _get_client(self) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        """Return the keep-alive client, or a one-shot client once aclose() has run."""
+        if self._closed:
+            return httpx.AsyncClient(proxy=self.proxy)
+        if self._client is None:
+            self._client = httpx.AsyncClient(proxy=self.proxy)
+        return nullcontext(self._client)
+
+    async def aclose(self) -> None:
+        """Close the keep-alive client; later searches use one-shot clients."""
+        self._closed = True
+        if self._client:
+            await self._client.aclose()
+            self._client = None
 
     @property
     def api_key(self) -> str:
@@ -79,7 +98,7 @@ class WebSearchTool(Tool):
         try:
             n = min(max(count or self.max_results, 1), 10)
             logger.debug("WebSearch: {}", "proxy enabled" if self.proxy else "direct connection")
-            async with httpx.AsyncClient(proxy=self.proxy) as client:
+            async with self._get_client() as client:
                 r = await client.get(
                     "https://api.search.brave.com/res/v1/web/search",
                     params={"q": query, "count": n},
@@ -120,6 +139,7 @@ class WebFetchTool(Tool):
         },
         "required": ["url"]
     }
+    parallel_safe = True
 
     def __init__(self, max_chars: int = 50000, proxy: str | None = None):
         self.max_chars = max_chars
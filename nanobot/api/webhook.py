@@ -1,5 +1,6 @@
 """Webhook HTTP server for external notifications."""
 
+import hmac
 import secrets
 
 from aiohttp import web
@@ -58,7 +59,9 @@ class WebhookServer:
     async def _handle_notify(self, request: web.Request) -> web.Response:
         # Auth
         auth = request.headers.get("Authorization", "")
-        if not auth.startswith("Bearer ") or auth[7:] != self.secret:
+        if not auth.startswith("Bearer ") or not hmac.compare_digest(
+            auth[7:].encode(), self.secret.encode()
+        ):
             return web.json_response({"error": "unauthorized"}, status=401)
 
         # Parse body
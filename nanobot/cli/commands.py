@@ -481,10 +481,11 @@ def gateway(
         finally:
             await agent.close_mcp()
             await webhook.stop()
-            heartbeat.stop()
+            await heartbeat.stop()
             cron.stop()
             agent.stop()
             await channels.stop_all()
+            await agent.aclose()
 
     asyncio.run(run())
 
@@ -574,6 +575,7 @@ def agent(
                 response = await agent_loop.process_direct(message, session_id, on_progress=_cli_progress)
             _print_agent_response(response, render_markdown=markdown)
             await agent_loop.close_mcp()
+            await agent_loop.aclose()
 
         asyncio.run(run_once())
     else:
@@ -678,6 +680,7 @@ def agent(
                 outbound_task.cancel()
                 await asyncio.gather(bus_task, outbound_task, return_exceptions=True)
                 await agent_loop.close_mcp()
+                await agent_loop.aclose()
 
         asyncio.run(run_interactive())
 
@@ -118,12 +118,13 @@ class HeartbeatService:
         self._task = asyncio.create_task(self._run_loop())
         logger.info("Heartbeat started (every {}s)", self.interval_s)
 
-    def stop(self) -> None:
-        """Stop the heartbeat service."""
+    async def stop(self) -> None:
+        """Stop the heartbeat service and wait for the loop task to finish."""
         self._running = False
         if self._task:
-            self._task.cancel()
-            self._task = None
+            task, self._task = self._task, None
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
 
     async def _run_loop(self) -> None:
         """Main heartbeat loop."""
@@ -1,5 +1,6 @@
 """Base LLM provider interface."""
 
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
@@ -12,6 +13,17 @@ class ToolCallRequest:
     name: str
     arguments: dict[str, Any]
 
+    def to_openai_tool_call(self) -> dict[str, Any]:
+        """Serialize to the OpenAI assistant-message ``tool_calls`` entry format."""
+        return {
+            "id": self.id,
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "arguments": json.dumps(self.arguments, ensure_ascii=False),
+            },
+        }
+
 
 @dataclass
 class LLMResponse:
@@ -154,6 +154,7 @@ def mock_agent_runtime(tmp_path):
         agent_loop.channels_config = None
         agent_loop.process_direct = AsyncMock(return_value="mock-response")
         agent_loop.close_mcp = AsyncMock(return_value=None)
+        agent_loop.aclose = AsyncMock(return_value=None)
         mock_agent_loop_cls.return_value = agent_loop
 
         yield {
@@ -230,6 +231,9 @@ def test_agent_config_sets_active_path(monkeypatch, tmp_path: Path) -> None:
         async def close_mcp(self) -> None:
             return None
 
+        async def aclose(self) -> None:
+            return None
+
     monkeypatch.setattr("nanobot.agent.loop.AgentLoop", _FakeAgentLoop)
     monkeypatch.setattr("nanobot.cli.commands._print_agent_response", lambda *_args, **_kwargs: None)
 
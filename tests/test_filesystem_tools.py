@@ -0,0 +1,23 @@
+import pytest
+
+from nanobot.agent.tools.filesystem import ListDirTool
+
+
+@pytest.mark.asyncio
+async def test_list_dir_sorts_entries_and_marks_directories(tmp_path) -> None:
+    (tmp_path / "b.md").write_text("b", encoding="utf-8")
+    (tmp_path / "a").mkdir()
+    (tmp_path / "C.txt").write_text("c", encoding="utf-8")
+
+    result = await ListDirTool(workspace=tmp_path).execute(path=".")
+
+    assert result.splitlines() == ["📄 C.txt", "📁 a", "📄 b.md"]
+
+
+@pytest.mark.asyncio
+async def test_list_dir_reports_empty_directory(tmp_path) -> None:
+    assert await ListDirTool(workspace=tmp_path).execute(path=".") == "Directory . is empty"
+
+
+def test_parameter_schema_is_shared_between_instances(tmp_path) -> None:
+    assert ListDirTool(workspace=tmp_path).parameters is ListDirTool().parameters
@@ -34,8 +34,30 @@ async def test_start_is_idempotent(tmp_path) -> None:
 
     assert service._task is first_task
 
-    service.stop()
-    await asyncio.sleep(0)
+    await service.stop()
+    assert service._task is None
+    assert first_task.done()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_starts_create_single_task(tmp_path) -> None:
+    service = HeartbeatService(
+        workspace=tmp_path,
+        provider=DummyProvider([]),
+        model="openai/gpt-4o-mini",
+        interval_s=9999,
+        enabled=True,
+    )
+
+    await asyncio.gather(service.start(), service.start(), service.start())
+    loops = [
+        t for t in asyncio.all_tasks()
+        if t.get_coro().__qualname__ == "HeartbeatService._run_loop"
+    ]
+
+    assert loops == [service._task]
+
+    await service.stop()
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,122 @@
+"""Tests for SubagentManager tool setup and prompt construction."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from nanobot.agent.subagent import SubagentManager
+from nanobot.bus.queue import MessageBus
+from nanobot.providers.base import LLMResponse, ToolCallRequest
+
+
+def _make_manager(tmp_path: Path) -> SubagentManager:
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    return SubagentManager(provider=provider, workspace=tmp_path, bus=MessageBus())
+
+
+def _write_skill(workspace: Path, name: str, description: str, metadata: str = "") -> Path:
+    skill_file = workspace / "skills" / name / "SKILL.md"
+    skill_file.parent.mkdir(parents=True, exist_ok=True)
+    meta_line = f"metadata: {metadata}\n" if metadata else ""
+    skill_file.write_text(
+        f"---\ndescription: {description}\n{meta_line}---\n\n# {name}\n", encoding="utf-8"
+    )
+    return skill_file
+
+
+def test_skill_entries_reused_between_spawns(tmp_path) -> None:
+    mgr = _make_manager(tmp_path)
+
+    prompt = mgr._build_subagent_prompt()
+    assert prompt.startswith("# Subagent\n\n")
+    assert str(tmp_path) in prompt
+    assert mgr._skill_entries() is mgr._skill_entries()
+
+
+def test_prompt_rechecks_skill_requirements_each_build(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("ZZ_TOKEN", raising=False)
+    _write_skill(tmp_path, "needs-env", "gated", '{"nanobot": {"requires": {"env": ["ZZ_TOKEN"]}}}')
+    mgr = _make_manager(tmp_path)
+
+    prompt = mgr._build_subagent_prompt()
+    assert '<skill available="false">\n    <name>needs-env</name>' in prompt
+    assert "<requires>ENV: ZZ_TOKEN</requires>" in prompt
+
+    monkeypatch.setenv("ZZ_TOKEN", "set")
+    prompt = mgr._build_subagent_prompt()
+    assert '<skill available="true">\n    <name>needs-env</name>' in prompt
+    assert "ZZ_TOKEN" not in prompt
+
+
+def test_prompt_body_tracks_skill_changes(tmp_path) -> None:
+    mgr = _make_manager(tmp_path)
+    assert "my-skill" not in mgr._build_subagent_prompt()
+
+    skill_file = _write_skill(tmp_path, "my-skill", "first")
+    assert "first" in mgr._build_subagent_prompt()
+
+    _write_skill(tmp_path, "my-skill", "second")
+    stat = skill_file.stat()
+    os.utime(skill_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    prompt = mgr._build_subagent_prompt()
+    assert "second" in prompt
+    assert "first" not in prompt
+
+
+def test_tool_factories_build_fresh_tools_matching_their_names(tmp_path) -> None:
+    mgr = _make_manager(tmp_path)
+
+    for name, factory in mgr._tool_factories.items():
+        tool = factory()
+        assert tool.name == name
+        if name == "web_search":
+            assert factory() is tool  # shares one keep-alive client across runs
+        else:
+            assert factory() is not tool
+    assert "message" not in mgr._tool_factories
+    assert "spawn" not in mgr._tool_factories
+
+
+@pytest.mark.asyncio
+async def test_run_subagent_records_tool_calls_and_announces_result(tmp_path) -> None:
+    (tmp_path / "notes.txt").write_text("hello", encoding="utf-8")
+    calls: list[list[dict[str, Any]]] = []
+    responses = [
+        LLMResponse(
+            content="",
+            tool_calls=[
+                ToolCallRequest(id="c1", name="read_file", arguments={"path": "notes.txt"}),
+                ToolCallRequest(id="c2", name="list_dir", arguments={"path": "."}),
+            ],
+        ),
+        LLMResponse(content="all done"),
+    ]
+
+    async def chat(*, messages, **kwargs) -> LLMResponse:
+        calls.append(list(messages))
+        return responses.pop(0)
+
+    mgr = _make_manager(tmp_path)
+    mgr.provider.chat = chat
+
+    await mgr._run_subagent("t1", "read notes", "read notes", {"channel": "cli", "chat_id": "direct"})
+
+    assistant, read_result, list_result = calls[1][2:]
+    assert assistant["tool_calls"][0] == {
+        "id": "c1",
+        "type": "function",
+        "function": {"name": "read_file", "arguments": '{"path": "notes.txt"}'},
+    }
+    assert (read_result["tool_call_id"], read_result["content"]) == ("c1", "hello")
+    assert list_result["tool_call_id"] == "c2"
+    assert "notes.txt" in list_result["content"]
+
+    announced = await mgr.bus.consume_inbound()
+    assert announced.chat_id == "cli:direct"
+    assert "all done" in announced.content
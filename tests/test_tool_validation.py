@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 from nanobot.agent.tools.base import Tool
@@ -337,3 +338,83 @@ def test_cast_params_single_value_not_auto_wrapped_to_array() -> None:
     assert result["items"] == 5  # Not wrapped to [5]
     result = tool.cast_params({"items": "text"})
     assert result["items"] == "text"  # Not wrapped to ["text"]
+
+
+async def test_registry_resolves_parameters_once_per_tool() -> None:
+    calls = 0
+
+    class CountingTool(SampleTool):
+        @property
+        def parameters(self) -> dict[str, Any]:
+            nonlocal calls
+            calls += 1
+            return super().parameters
+
+    reg = ToolRegistry()
+    reg.register(CountingTool())
+    for _ in range(3):
+        assert await reg.execute("sample", {"query": "hi", "count": 2}) == "ok"
+    assert calls == 1
+
+
+def test_registry_definitions_cached_until_tool_set_changes() -> None:
+    reg = ToolRegistry()
+    reg.register(SampleTool())
+    first = reg.get_definitions()
+    first.clear()
+    second = reg.get_definitions()
+    assert [d["function"]["name"] for d in second] == ["sample"]
+    assert second[0] is reg.get_definitions()[0]
+
+    reg.register(CastTestTool({"type": "object", "properties": {}}))
+    assert [d["function"]["name"] for d in reg.get_definitions()] == ["sample", "cast_test"]
+
+    reg.apply_disabled_filter(["cast_*"])
+    assert [d["function"]["name"] for d in reg.get_definitions()] == ["sample"]
+
+    reg.unregister("sample")
+    assert reg.get_definitions() == []
+
+
+class _RecordingTool(Tool):
+    def __init__(self, name: str, log: list[str], parallel_safe: bool) -> None:
+        self._name = name
+        self._log = log
+        self.parallel_safe = parallel_safe
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return "records start/end order"
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return {"type": "object", "properties": {"id": {"type": "string"}}}
+
+    async def execute(self, id: str, **kwargs: Any) -> str:
+        self._log.append(f"start {id}")
+        await asyncio.sleep(0)
+        self._log.append(f"end {id}")
+        return id
+
+
+async def test_registry_execute_all_batches_parallel_safe_tools() -> None:
+    log: list[str] = []
+    reg = ToolRegistry()
+    reg.register(_RecordingTool("read", log, parallel_safe=True))
+    reg.register(_RecordingTool("write", log, parallel_safe=False))
+
+    results = await reg.execute_all([
+        ("read", {"id": "r1"}),
+        ("read", {"id": "r2"}),
+        ("write", {"id": "w1"}),
+        ("read", {"id": "r3"}),
+        ("missing", {}),
+    ])
+
+    assert results[:4] == ["r1", "r2", "w1", "r3"]
+    assert "Tool 'missing' not found" in results[4]
+    assert log == ["start r1", "start r2", "end r1", "end r2", "start w1", "end w1", "start r3", "end r3"]
@@ -0,0 +1,91 @@
+import asyncio
+
+import httpx
+import pytest
+
+from nanobot.agent.subagent import SubagentManager
+from nanobot.agent.tools.web import WebSearchTool
+from nanobot.bus.queue import MessageBus
+
+
+def _search_handler(requests: list[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"web": {"results": [{"title": "Nanobot", "url": "https://x"}]}})
+
+    return handler
+
+
+@pytest.fixture
+def mock_clients(monkeypatch) -> tuple[list[httpx.Request], list[httpx.AsyncClient]]:
+    """Route every httpx.AsyncClient the tool builds through a mock transport."""
+    requests: list[httpx.Request] = []
+    clients: list[httpx.AsyncClient] = []
+    real_client = httpx.AsyncClient
+
+    def factory(**kwargs) -> httpx.AsyncClient:
+        kwargs.pop("proxy", None)
+        client = real_client(transport=httpx.MockTransport(_search_handler(requests)), **kwargs)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(httpx, "AsyncClient", factory)
+    return requests, clients
+
+
+@pytest.mark.asyncio
+async def test_web_search_reuses_keep_alive_client(mock_clients) -> None:
+    requests, clients = mock_clients
+    tool = WebSearchTool(api_key="k")
+
+    assert "1. Nanobot" in await tool.execute(query="nanobot")
+    assert "1. Nanobot" in await tool.execute(query="nanobot", count=2)
+
+    assert len(requests) == 2
+    assert requests[1].url.params["count"] == "2"
+    assert len(clients) == 1
+    assert not clients[0].is_closed
+
+    await tool.aclose()
+    assert clients[0].is_closed
+
+
+@pytest.mark.asyncio
+async def test_web_search_after_aclose_uses_one_shot_client(mock_clients) -> None:
+    requests, clients = mock_clients
+    tool = WebSearchTool(api_key="k")
+    await tool.execute(query="before")
+    await tool.aclose()
+
+    assert "1. Nanobot" in await tool.execute(query="after")
+
+    assert len(requests) == 2
+    assert len(clients) == 2
+    assert all(c.is_closed for c in clients)
+    assert tool._client is None
+
+
+@pytest.mark.asyncio
+async def test_subagent_manager_aclose_stops_subagents_before_closing_client(tmp_path, mock_clients) -> None:
+    _, clients = mock_clients
+    provider = type("P", (), {"get_default_model": lambda self: "m"})()
+    mgr = SubagentManager(provider=provider, workspace=tmp_path, bus=MessageBus(), brave_api_key="k")
+    await mgr._web_search.execute(query="warm up")
+
+    cancelled = asyncio.Event()
+
+    async def slow() -> None:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            assert not clients[0].is_closed
+            cancelled.set()
+            raise
+
+    mgr._running_tasks["t1"] = asyncio.create_task(slow())
+    await asyncio.sleep(0)
+
+    await mgr.aclose()
+
+    assert cancelled.is_set()
+    assert clients[0].is_closed
@@ -0,0 +1,75 @@
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from aiohttp import StreamReader, web
+from aiohttp.test_utils import make_mocked_request
+
+from nanobot.api.webhook import WebhookServer
+from nanobot.bus.queue import MessageBus
+
+
+def _notify_request(body: bytes, token: str = "s3cret") -> web.Request:
+    payload = StreamReader(MagicMock(), 2**16, loop=asyncio.get_running_loop())
+    payload.feed_data(body)
+    payload.feed_eof()
+    return make_mocked_request(
+        "POST",
+        "/notify",
+        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+        payload=payload,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "auth",
+    ["", "Bearer wrong", "Basic s3cret", "Bearer s3cre", "Bearer s3crét"],
+)
+async def test_notify_rejects_bad_token(auth: str) -> None:
+    server = WebhookServer(MessageBus(), secret="s3cret")
+    headers = {"Authorization": auth} if auth else {}
+    request = make_mocked_request("POST", "/notify", headers=headers)
+
+    response = await server._handle_notify(request)
+
+    assert response.status == 401
+    assert json.loads(response.text) == {"error": "unauthorized"}
+    assert server.bus.inbound_size == 0
+
+
+@pytest.mark.asyncio
+async def test_notify_publishes_system_message() -> None:
+    server = WebhookServer(MessageBus(), secret="s3cret")
+    request = _notify_request(b'{"message": "build green", "channel": "telegram", "chat_id": "42"}')
+
+    response = await server._handle_notify(request)
+
+    assert response.status == 202
+    msg = await server.bus.consume_inbound()
+    assert msg.channel == "system"
+    assert msg.sender_id == "webhook"
+    assert msg.chat_id == "telegram:42"
+    assert msg.content == "build green"
+
+
+@pytest.mark.asyncio
+async def test_notify_rejects_invalid_json() -> None:
+    server = WebhookServer(MessageBus(), secret="s3cret")
+
+    response = await server._handle_notify(_notify_request(b'{"message": '))
+
+    assert response.status == 400
+
+
+@pytest.mark.asyncio
+async def test_notify_accepts_stdlib_json_extensions() -> None:
+    server = WebhookServer(MessageBus(), secret="s3cret")
+    body = b'{"message": "odd \\ud800 value", "channel": "cli", "chat_id": "direct", "score": NaN}'
+
+    response = await server._handle_notify(_notify_request(body))
+
+    assert response.status == 202
+    msg = await server.bus.consume_inbound()
+    assert msg.content == "odd \ud800 value"